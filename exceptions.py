@@ -7,6 +7,12 @@ class APIError(Exception):
     pass
 
 
+class TransientAPIError(APIError):
+    """Исключение при временном сбое API, допускающем повтор запроса."""
+
+    pass
+
+
 class ResponseError(Exception):
     """Исключение при некорректном ответе API."""
 
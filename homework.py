@@ -2,15 +2,24 @@
 
 import logging
 import os
+import random
 import sys
 import time
+from collections import OrderedDict
+from functools import wraps
 from http import HTTPStatus
 
 import requests
 import telebot
 from dotenv import load_dotenv
 
-from exceptions import APIError, ResponseError, CurrentDateError
+from exceptions import (
+    APIError,
+    CurrentDateError,
+    ResponseError,
+    StatusError,
+    TransientAPIError,
+)
 
 # Загрузка переменных окружения из .env файла
 load_dotenv()
@@ -26,12 +35,67 @@ RETRY_PERIOD = 600  # 10 минут в секундах
 ENDPOINT = 'https://practicum.yandex.ru/api/user_api/homework_statuses/'
 HEADERS = {'Authorization': f'OAuth {PRACTICUM_TOKEN}'}
 
+# Адрес для приёма обновлений Telegram; если не задан,
+# бот работает в режиме периодического опроса.
+WEBHOOK_URL = os.getenv('WEBHOOK_URL')
+
+# Параметры экспоненциальной задержки при повторных запросах
+BASE_DELAY = 0.25  # базовая задержка в секундах
+MAX_DELAY = 30.0  # потолок задержки в секундах
+JITTER = 0.5  # доля случайного разброса задержки
+MAX_RETRIES = 3  # число попыток запроса к API
+
+# Таймауты подключения и чтения: зависший запрос не должен
+# останавливать бот навсегда.
+REQUEST_TIMEOUT = (5, 30)
+
+# Максимум запомненных пар (id, status) для защиты от повторной отправки
+SEEN_CACHE_SIZE = 256
+
+# Коды ответов API как простые int: сравнение без диспетчеризации IntEnum
+_OK = HTTPStatus.OK.value
+_TOO_MANY_REQUESTS = HTTPStatus.TOO_MANY_REQUESTS.value
+_SERVER_ERROR = HTTPStatus.INTERNAL_SERVER_ERROR.value
+
 HOMEWORK_VERDICTS = {
     'approved': 'Работа проверена: ревьюеру всё понравилось. Ура!',
     'reviewing': 'Работа взята на проверку ревьюером.',
     'rejected': 'Работа проверена: у ревьюера есть замечания.'
 }
 
+# Шаблон сообщения о смене статуса; метод format связывается один раз
+_MSG_TMPL = 'Изменился статус проверки работы "{}". {}'.format
+
+
+def retry(exceptions, attempts=MAX_RETRIES, base_delay=BASE_DELAY):
+    """
+    Повторяет вызов функции при временных ошибках.
+
+    Args:
+        exceptions: Класс или кортеж классов исключений,
+            считающихся временными.
+        attempts (int): Общее число попыток вызова.
+        base_delay (float): Базовая задержка между попытками в секундах.
+
+    Returns:
+        callable: Декоратор, повторяющий вызов с экспоненциальной
+            задержкой; после исчерпания попыток исключение
+            пробрасывается дальше.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(attempts):
+                try:
+                    return func(*args, **kwargs)
+                except exceptions:
+                    if attempt == attempts - 1:
+                        raise
+                    delay = min(MAX_DELAY, base_delay * 2 ** attempt)
+                    time.sleep(delay * (1 + random.random() * JITTER))
+        return wrapper
+    return decorator
+
 
 def check_tokens():
     """
@@ -43,21 +107,37 @@ def check_tokens():
     Returns:
         bool: True если все переменные присутствуют, False в противном случае.
     """
-    required_tokens = ('PRACTICUM_TOKEN', 'TELEGRAM_TOKEN', 'TELEGRAM_CHAT_ID')
+    required_tokens = (
+        ('PRACTICUM_TOKEN', PRACTICUM_TOKEN),
+        ('TELEGRAM_TOKEN', TELEGRAM_TOKEN),
+        ('TELEGRAM_CHAT_ID', TELEGRAM_CHAT_ID),
+    )
     missing_tokens = [
-        token_name for token_name in required_tokens
-        if not globals().get(token_name)
+        token_name for token_name, token_value in required_tokens
+        if not token_value
     ]
 
     if missing_tokens:
         logger.critical(
-            f"Отсутствуют обязательные переменные окружения: "
-            f"{', '.join(missing_tokens)}"
+            'Отсутствуют обязательные переменные окружения: %s',
+            ', '.join(missing_tokens)
         )
 
     return not missing_tokens
 
 
+@retry(telebot.apihelper.ApiException, attempts=2)
+def _deliver_message(bot, message):
+    """
+    Непосредственно отправляет сообщение через Telegram API.
+
+    Args:
+        bot: Экземпляр класса TeleBot.
+        message (str): Текст сообщения для отправки.
+    """
+    bot.send_message(TELEGRAM_CHAT_ID, message)
+
+
 def send_message(bot, message):
     """
     Отправляет сообщение в Telegram-чат.
@@ -65,16 +145,13 @@ def send_message(bot, message):
     Args:
         bot: Экземпляр класса TeleBot.
         message (str): Текст сообщения для отправки.
-
-    Raises:
-        telebot.apihelper.ApiException: При ошибке отправки сообщения.
     """
     try:
-        bot.send_message(TELEGRAM_CHAT_ID, message)
+        _deliver_message(bot, message)
     except telebot.apihelper.ApiException as error:
-        logger.error(f'Сбой при отправке сообщения в Telegram: {error}')
+        logger.error('Сбой при отправке сообщения в Telegram: %s', error)
     else:
-        logger.debug(f'Бот отправил сообщение "{message}"')
+        logger.debug('Бот отправил сообщение "%s"', message)
 
 
 def send_if_new(bot, message, last_message):
@@ -95,6 +172,7 @@ def send_if_new(bot, message, last_message):
     return last_message
 
 
+@retry(TransientAPIError)
 def get_api_answer(timestamp):
     """
     Делает запрос к API сервиса Практикум Домашка.
@@ -106,23 +184,39 @@ def get_api_answer(timestamp):
         dict: Ответ API в формате Python dict.
 
     Raises:
-        APIError: При проблемах с доступностью эндпоинта.
+        APIError: При постоянных ошибках эндпоинта (прочие коды ответа).
+        TransientAPIError: При временных сбоях (сетевые ошибки, коды 5xx
+            и 429); такие вызовы повторяет декоратор retry.
     """
     params = {'from_date': timestamp}
 
     try:
-        logger.debug(f'Начало запроса к API с параметрами: {params}')
-        response = requests.get(ENDPOINT, headers=HEADERS, params=params)
-
-        if response.status_code != HTTPStatus.OK:
-            raise APIError(
-                f'Эндпоинт {ENDPOINT} недоступен. '
-                f'Код ответа API: {response.status_code}'
-            )
+        logger.debug('Начало запроса к API с параметрами: %s', params)
+        response = requests.get(
+            ENDPOINT,
+            headers=HEADERS,
+            params=params,
+            timeout=REQUEST_TIMEOUT,
+        )
+    except requests.RequestException as error:
+        # Сетевые ошибки считаем временными
+        raise TransientAPIError(f'Ошибка при запросе к API: {error}')
+
+    if response.status_code == _OK:
         return response.json()
 
-    except requests.RequestException as error:
-        raise APIError(f'Ошибка при запросе к API: {error}')
+    message = (
+        f'Эндпоинт {ENDPOINT} недоступен. '
+        f'Код ответа API: {response.status_code}'
+    )
+    if (
+        response.status_code >= _SERVER_ERROR
+        or response.status_code == _TOO_MANY_REQUESTS
+    ):
+        raise TransientAPIError(message)
+
+    # Повтор не поможет — ошибка на стороне запроса
+    raise APIError(message)
 
 
 def check_response(response):
@@ -174,23 +268,76 @@ def parse_status(homework):
 
     Raises:
         KeyError: При отсутствии ожидаемых ключей в данных.
-        ValueError: При неожиданном статусе домашней работы.
+        StatusError: При неожиданном статусе домашней работы.
     """
-    if 'homework_name' not in homework:
+    homework_name = homework.get('homework_name')
+    if homework_name is None:
         raise KeyError('Отсутствует ключ "homework_name" в ответе API')
 
-    if 'status' not in homework:
+    status = homework.get('status')
+    if status is None:
         raise KeyError('Отсутствует ключ "status" в ответе API')
 
-    homework_name = homework['homework_name']
-    status = homework['status']
+    verdict = HOMEWORK_VERDICTS.get(status)
+    if verdict is None:
+        raise StatusError(f'Неожиданный статус домашней работы: {status}')
+
+    return _MSG_TMPL(homework_name, verdict)
+
+
+def poll_once(bot, timestamp, seen):
+    """
+    Выполняет один цикл опроса API и рассылает новые статусы.
+
+    Args:
+        bot: Экземпляр класса TeleBot.
+        timestamp (int): Временная метка, с которой запрашиваются статусы.
+        seen (OrderedDict): Кеш уже отправленных пар (id, status).
+
+    Returns:
+        int: Обновлённая временная метка для следующего опроса.
+    """
+    # Получение ответа от API
+    response = get_api_answer(timestamp)
+
+    # Проверка ответа
+    homeworks = check_response(response)
+
+    if homeworks:
+        # Пакетная обработка: сначала все сообщения, затем отправка
+        messages = [parse_status(homework) for homework in homeworks]
+        for homework, message in zip(homeworks, messages):
+            key = (homework.get('id'), homework.get('status'))
+            if key in seen:
+                # Такой статус уже отправлялся — не дублируем
+                continue
+            seen[key] = None
+            if len(seen) > SEEN_CACHE_SIZE:
+                seen.popitem(last=False)
+            send_message(bot, message)
+
+        # Обновление временной метки
+        return response.get('current_date', timestamp)
+
+    logger.debug('Отсутствие в ответе новых статусов')
+    return timestamp
 
-    if status not in HOMEWORK_VERDICTS:
-        raise ValueError(f'Неожиданный статус домашней работы: {status}')
 
-    verdict = HOMEWORK_VERDICTS[status]
+def configure_logging():
+    """
+    Настраивает логирование при запуске бота как программы.
 
-    return f'Изменился статус проверки работы "{homework_name}". {verdict}'
+    Вызывается только из блока `if __name__ == '__main__'`: при импорте
+    модуля (например, в тестах) обработчики не навешиваются. Параметр
+    `force=True` снимает ранее навешанные обработчики, исключая их
+    дублирование при повторной настройке.
+    """
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format='%(asctime)s [%(levelname)s] %(message)s',
+        handlers=[logging.StreamHandler(sys.stdout)],
+        force=True
+    )
 
 
 def main():
@@ -207,51 +354,48 @@ def main():
     # Переменная для хранения последней ошибки
     last_error_message = ''
 
+    # Счётчик подряд идущих неудачных итераций
+    failure_streak = 0
+
+    # Кеш отправленных статусов на время работы бота
+    seen = OrderedDict()
+
+    if WEBHOOK_URL:
+        # Приём команд от Telegram через webhook вместо опроса
+        # getUpdates; статусы Практикума по-прежнему опрашиваются ниже.
+        bot.set_webhook(url=WEBHOOK_URL)
+
     logger.info('Бот запущен')
 
     while True:
         try:
-            # Получение ответа от API
-            response = get_api_answer(timestamp)
-
-            # Проверка ответа
-            homeworks = check_response(response)
-
-            # Обработка домашних работ — интересует только последняя
-            if homeworks:
-                message = parse_status(homeworks[0])
-                last_error_message = send_if_new(
-                    bot,
-                    message,
-                    last_error_message,
-                )
-
-                # Обновление временной метки
-                timestamp = response.get('current_date', timestamp)
-            else:
-                logger.debug('Отсутствие в ответе новых статусов')
+            timestamp = poll_once(bot, timestamp, seen)
 
             # Сброс последней ошибки при успешном выполнении
             last_error_message = ''
+            failure_streak = 0
 
         except CurrentDateError as error:
             # Только логируем, не отправляем в Telegram
-            logger.error(f'Сбой в работе программы: {error}')
+            failure_streak += 1
+            logger.error('Сбой в работе программы: %s', error)
 
         except Exception as error:
+            failure_streak += 1
             message = f'Сбой в работе программы: {error}'
             logger.error(message)
             last_error_message = send_if_new(bot, message, last_error_message)
 
         finally:
-            # Ожидание перед следующей проверкой
-            time.sleep(RETRY_PERIOD)
+            if failure_streak:
+                # Быстрый повтор после сбоя с экспоненциальной задержкой
+                delay = min(MAX_DELAY, BASE_DELAY * 2 ** failure_streak)
+                time.sleep(delay * (1 + random.random() * JITTER))
+            else:
+                # Ожидание перед следующей проверкой
+                time.sleep(RETRY_PERIOD)
 
 
 if __name__ == '__main__':
-    logging.basicConfig(
-        level=logging.DEBUG,
-        format='%(asctime)s [%(levelname)s] %(message)s',
-        handlers=[logging.StreamHandler(sys.stdout)]
-    )
+    configure_logging()
     main()